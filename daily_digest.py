@@ -10,12 +10,23 @@ open source releases, and industry developments from across the AI ecosystem.
 import os
 import json
 import time
+import argparse
 import re
+import heapq
+import hashlib
+import random
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, zip_longest
 from datetime import datetime, timezone, timedelta
+from urllib.parse import urlsplit, urlunsplit
 
 # EST timezone (UTC-5)
 EST = timezone(timedelta(hours=-5))
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # =============================================================================
 # CONFIGURATION
@@ -25,23 +36,270 @@ import requests
 TAVILY_API_KEY = os.getenv("TAVILY_API_KEY")
 GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 
-# Groq model that supports MCP tools (from Groq docs)
-GROQ_MODEL = "openai/gpt-oss-120b"
+# Groq model that supports MCP tools (from Groq docs). Override with the
+# GROQ_MODEL env var to try a faster model; it must support remote MCP tools,
+# see https://console.groq.com/docs/models
+GROQ_MODEL = os.getenv("GROQ_MODEL", "openai/gpt-oss-120b")
 
 # Search Configuration
 MAX_ARTICLES = 10
 
+# Articles whose titles share at least this fraction of words are treated
+# as duplicate coverage of the same story
+DUPLICATE_TITLE_SIMILARITY = 0.75
+TITLE_WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Size limits applied to model output as soon as it is parsed, so a runaway
+# response cannot bloat the rendered digest
+MAX_INTRO_CHARS = 1000
+MAX_TITLE_CHARS = 200
+MAX_SUMMARY_CHARS = 1000
+MAX_URL_CHARS = 2000
+MAX_SOURCE_CHARS = 100
+MAX_TOPICS_PER_ARTICLE = 5
+
 # Output directory for digests
 DIGEST_DIR = "digests"
 
+# Set DIGEST_DEBUG=1 to log the start of the raw Groq response when no
+# output text could be extracted
+DEBUG = bool(os.getenv("DIGEST_DEBUG"))
+
+# Sampling parameters for every Groq call (low temperature for stable picks)
+GROQ_TEMPERATURE = 0.1
+GROQ_TOP_P = 0.4
+
+# Local cache of curated results (re-runs on the same day skip Groq/Tavily).
+# Entries expire after DIGEST_CACHE_TTL seconds (default 6h); 0 disables it.
+CACHE_DIR = ".cache"
+CACHE_TTL_SECONDS = int(os.getenv("DIGEST_CACHE_TTL", "21600"))
+
+# Retries for Groq requests: exponential backoff with jitter (2s, 4s, 8s),
+# honoring the server's Retry-After header on 429/503 responses. Both kinds
+# of wait are capped at RETRY_MAX_DELAY seconds.
+GROQ_MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 2
+RETRY_MAX_DELAY = 60
+
+
+class GroqRetry(Retry):
+    """urllib3 Retry that waits before the first retry and caps Retry-After."""
+    
+    def get_backoff_time(self) -> float:
+        # urllib3 retries the first failure immediately; back off from the start
+        if not self.history:
+            return 0
+        backoff = self.backoff_factor * (2 ** (len(self.history) - 1))
+        if self.backoff_jitter:
+            backoff += random.random() * self.backoff_jitter
+        return min(self.backoff_max, backoff)
+    
+    def get_retry_after(self, response) -> float | None:
+        # A daily-limit 429 can ask for hours; never block the run that long
+        seconds = super().get_retry_after(response)
+        return None if seconds is None else min(seconds, RETRY_MAX_DELAY)
+
+
+# Shared HTTP session so retries reuse the same pooled TLS connection
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=GroqRetry(
+        total=GROQ_MAX_RETRIES,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        backoff_max=RETRY_MAX_DELAY,
+        backoff_jitter=1.0,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["POST"],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    ),
+))
+
+# =============================================================================
+# RESPONSE CACHE - Skip repeat Groq/Tavily calls for the same day and prompt
+# =============================================================================
+
+def cache_key(prompt: str, date_str: str) -> str:
+    """Build a cache key from the model, sampling settings, digest date and prompt."""
+    raw = f"{GROQ_MODEL}|{GROQ_TEMPERATURE}|{GROQ_TOP_P}|{date_str}|{prompt}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def load_cached_digest(key: str) -> dict | None:
+    """Return a previously curated digest for this key, if one is cached and fresh."""
+    if CACHE_TTL_SECONDS <= 0:
+        return None
+    
+    path = os.path.join(CACHE_DIR, f"{key}.json")
+    try:
+        with open(path, encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    
+    if not isinstance(entry, dict) or entry.get("expires_at", 0) < time.time():
+        return None
+    return entry.get("digest")
+
+
+def save_cached_digest(key: str, data: dict):
+    """
+    Store a successfully parsed digest so re-runs can reuse it.
+    Written to a temp file and renamed, so a crash never leaves a partial entry.
+    """
+    if CACHE_TTL_SECONDS <= 0:
+        return
+    
+    now = time.time()
+    entry = {
+        "model": GROQ_MODEL,
+        "created_at": now,
+        "expires_at": now + CACHE_TTL_SECONDS,
+        "digest": data,
+    }
+    path = os.path.join(CACHE_DIR, f"{key}.json")
+    tmp_path = f"{path}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"   ⚠ Could not write cache file {path}: {e}")
+
+
 # =============================================================================
 # GROQ + TAVILY MCP - Agentic Search & Summarization
 # =============================================================================
 
-def groq_with_tavily_mcp(prompt: str, max_retries: int = 3) -> str:
+# Server-sent event types read_response_stream acts on
+STREAM_EVENTS_USED = {
+    "response.output_text.delta",
+    "response.output_text.done",
+    "response.completed",
+    "response.incomplete",
+    "response.failed",
+}
+
+
+def first_json_object(text: str):
+    """Decode the JSON value starting at the first brace in text, or return None."""
+    start = text.find("{")
+    if start == -1:
+        return None
+    try:
+        return json.JSONDecoder().raw_decode(text, start)[0]
+    except json.JSONDecodeError:
+        return None
+
+
+def read_response_stream(response: requests.Response,
+                         is_answer: Callable[[object], bool] | None = None) -> tuple[str, dict]:
     """
-    Use Groq's Responses API with Tavily MCP tools.
-    The LLM decides when and how to use Tavily search/extract.
+    Read a streamed Responses API reply (server-sent events).
+    Returns the text of the last output message and the final response object.
+    
+    Deltas are collected per output item, so a preamble message the model
+    writes before calling its tools never runs into the answer. If is_answer
+    is given, stops as soon as a finished text part holds a JSON object it
+    accepts: the trailing events only repeat the whole response, including
+    every MCP tool trace, so there is no need to download and parse them.
+    Checking the object itself keeps a preamble that quotes tool arguments
+    from ending the read.
+    """
+    # Output item id -> text deltas, in the order the items started
+    item_parts = {}
+    final_response = {}
+    event_name = None
+    
+    for raw_line in response.iter_lines():
+        if raw_line.startswith(b"event:"):
+            event_name = raw_line[len(b"event:"):].strip().decode("utf-8")
+            continue
+        if not raw_line.startswith(b"data:"):
+            continue
+        
+        # Skip decoding events that are never used, such as MCP tool call
+        # traces carrying whole search results. Streams without event: lines
+        # are decoded in full.
+        skip = event_name is not None and event_name not in STREAM_EVENTS_USED
+        event_name = None
+        if skip:
+            continue
+        
+        chunk = raw_line[len(b"data:"):].strip()
+        if chunk == b"[DONE]":
+            break
+        try:
+            event = json.loads(chunk)
+        except json.JSONDecodeError:
+            continue
+        
+        event_type = event.get("type", "")
+        if event_type == "response.output_text.delta":
+            item_parts.setdefault(event.get("item_id"), []).append(event.get("delta", ""))
+        elif event_type == "response.output_text.done":
+            text = event.get("text", "")
+            if is_answer is not None and is_answer(first_json_object(text)):
+                response.close()
+                return text, final_response
+        elif event_type in ("response.completed", "response.incomplete", "response.failed"):
+            final_response = event.get("response", {})
+    
+    if not item_parts:
+        return "", final_response
+    return "".join(list(item_parts.values())[-1]), final_response
+
+
+def iter_output_text(data: dict):
+    """
+    Yield the text parts of the message items in a Responses API object,
+    newest first: the final answer comes after any MCP tool call traces.
+    """
+    output = data.get("output")
+    if not isinstance(output, list):
+        return
+    for item in reversed(output):
+        if item.get("type") != "message":
+            continue
+        for c in item.get("content", ()):
+            if c.get("type") in ("output_text", "text") and c.get("text"):
+                yield c["text"]
+
+
+def check_groq_access() -> bool:
+    """
+    Make a quick authenticated request to Groq before the long search calls.
+    A rejected key fails here within seconds instead of after a full response
+    timeout. The probe is a single attempt outside HTTP_SESSION; timeouts,
+    connection errors and other statuses only warn, leaving them to the
+    retries on the real calls. Returns False only for a 401/403.
+    """
+    url = "https://api.groq.com/openai/v1/models"
+    headers = {"Authorization": f"Bearer {GROQ_API_KEY}"}
+    
+    try:
+        response = requests.get(url, headers=headers, timeout=5)
+    except requests.exceptions.RequestException as e:
+        print(f"   ⚠ Groq API check failed, continuing: {e}")
+        return True
+    
+    if response.status_code in (401, 403):
+        print(f"✗ Groq rejected the API key (HTTP {response.status_code})")
+        return False
+    if not response.ok:
+        print(f"   ⚠ Groq API check returned HTTP {response.status_code}, continuing")
+    return True
+
+
+def groq_respond(prompt: str, tools: list[dict] | None = None,
+                 is_answer: Callable[[object], bool] | None = None) -> str:
+    """
+    Call Groq's Responses API and return the model's output text.
+    is_answer lets the stream stop early once the expected JSON answer is done.
+    Returns an empty string if the request fails or no text comes back.
     """
     url = "https://api.groq.com/openai/v1/responses"
     
@@ -50,6 +308,49 @@ def groq_with_tavily_mcp(prompt: str, max_retries: int = 3) -> str:
         "Content-Type": "application/json",
     }
     
+    payload = {
+        "model": GROQ_MODEL,
+        "input": prompt,
+        "temperature": GROQ_TEMPERATURE,
+        "top_p": GROQ_TOP_P,
+        "stream": True,
+    }
+    if tools:
+        payload["tools"] = tools
+    
+    try:
+        print("   Calling Groq Responses API...")
+        response = HTTP_SESSION.post(url, headers=headers, json=payload, timeout=180, stream=True)
+        response.raise_for_status()
+        output_text, data = read_response_stream(response, is_answer)
+        
+        # Fall back to the final response object if no text deltas arrived
+        if not output_text:
+            output_text = data.get("output_text", "")
+        if not output_text:
+            # Try alternative response structure
+            output_text = next(iter_output_text(data), "")
+        
+        if not output_text:
+            print(f"   ⚠ Groq returned no output text; response keys: {list(data)[:10]}")
+            if DEBUG:
+                print(f"   Raw response: {str(data)[:500]}")
+        
+        return output_text
+        
+    except requests.exceptions.RequestException as e:
+        print(f"✗ Groq error: {e}")
+        if hasattr(e, 'response') and e.response is not None:
+            print(f"  Response: {e.response.text[:500]}")
+        return ""
+
+
+def groq_with_tavily_mcp(prompt: str,
+                         is_answer: Callable[[object], bool] | None = None) -> str:
+    """
+    Use Groq's Responses API with Tavily MCP tools.
+    The LLM decides when and how to use Tavily search/extract.
+    """
     # Configure Tavily MCP as a tool (from Groq docs)
     tools = [{
         "type": "mcp",
@@ -57,180 +358,282 @@ def groq_with_tavily_mcp(prompt: str, max_retries: int = 3) -> str:
         "server_label": "tavily",
         "require_approval": "never",
     }]
+    return groq_respond(prompt, tools, is_answer)
+
+
+def canonical_url(url: str) -> str:
+    """
+    Drop the fragment and utm_* tracking parameters from a URL, so the same
+    story linked from different places compares equal.
+    """
+    parts = urlsplit(url)
+    query = "&".join(
+        param for param in parts.query.split("&")
+        if param and not param.lower().startswith("utm_")
+    )
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ""))
+
+
+def normalize_article(article: dict) -> dict:
+    """
+    Keep only the expected article fields, trimmed to their size limits,
+    with the URL in canonical form for duplicate detection.
+    Missing fields stay missing so the renderers can apply their defaults.
+    """
+    normalized = {}
+    for field, limit in (
+        ("title", MAX_TITLE_CHARS),
+        ("url", MAX_URL_CHARS),
+        ("summary", MAX_SUMMARY_CHARS),
+        ("source", MAX_SOURCE_CHARS),
+    ):
+        value = article.get(field)
+        if isinstance(value, str) and value.strip():
+            normalized[field] = value.strip()[:limit]
     
-    payload = {
-        "model": GROQ_MODEL,
-        "input": prompt,
-        "tools": tools,
-        "temperature": 0.1,
-        "top_p": 0.4,
-    }
+    if "url" in normalized:
+        normalized["url"] = canonical_url(normalized["url"])
     
-    for attempt in range(max_retries):
-        try:
-            print(f"   Calling Groq Responses API (attempt {attempt + 1})...")
-            response = requests.post(url, headers=headers, json=payload, timeout=180)
-            
-            # Handle rate limiting
-            if response.status_code == 429:
-                wait_time = (attempt + 1) * 15
-                print(f"   ⏳ Rate limited, waiting {wait_time}s before retry...")
-                time.sleep(wait_time)
-                continue
-            
-            response.raise_for_status()
-            data = response.json()
-            
-            # Extract the output text from the response
-            output_text = data.get("output_text", "")
-            if not output_text:
-                # Try alternative response structure
-                output = data.get("output", [])
-                if output and isinstance(output, list):
-                    for item in output:
-                        if item.get("type") == "message":
-                            content = item.get("content", [])
-                            for c in content:
-                                if c.get("type") == "output_text":
-                                    output_text = c.get("text", "")
-                                    break
-                                elif c.get("type") == "text":
-                                    output_text = c.get("text", "")
-                                    break
-            
-            if not output_text:
-                output_text = json.dumps(data)
-                print(f"   Debug - Raw response structure: {list(data.keys())}")
-            
-            return output_text
-            
-        except requests.exceptions.RequestException as e:
-            if attempt < max_retries - 1:
-                wait_time = (attempt + 1) * 15
-                print(f"   ⏳ Request error, waiting {wait_time}s before retry...")
-                time.sleep(wait_time)
-                continue
-            print(f"✗ Groq MCP error: {e}")
-            if hasattr(e, 'response') and e.response is not None:
-                print(f"  Response: {e.response.text[:500]}")
-            return ""
-    
-    return ""
-
-
-def search_and_curate_news() -> dict:
+    topics = article.get("topics")
+    if isinstance(topics, list):
+        unique_topics = dict.fromkeys(str(t) for t in topics if t)
+        normalized["topics"] = list(unique_topics)[:MAX_TOPICS_PER_ARTICLE]
+    
+    return normalized
+
+
+def dedupe_articles(articles: list[dict]) -> list[dict]:
     """
-    Use Groq + Tavily MCP to search for AI news and curate top stories.
-    Uses two complementary searches for diverse, unbiased coverage.
-    Credit usage: 2 basic searches/day = ~60 credits/month (well under 1000 limit)
+    Drop duplicate coverage of the same story, keeping the first (highest
+    ranked) article. Articles are duplicates if they share a URL or their
+    titles overlap by at least DUPLICATE_TITLE_SIMILARITY (Jaccard on words).
     """
+    kept = []
+    seen_urls = set()
+    seen_titles = []
 
-    # Dual-search strategy for diverse, unbiased AI news coverage
-    # Search 1: Industry news (product launches, business moves)
-    # Search 2: Technical/research news (papers, open source, breakthroughs)
-    prompt = f"""You have access to the Tavily MCP server. You MUST use the tavily_search tool to complete this task.
-
-STEP 1: Perform TWO searches to get diverse AI news coverage.
-
-SEARCH 1 - Industry & Product News:
-Call tavily_search with:
-{{
-    "query": "artificial intelligence product launch announcement funding acquisition partnership today",
-    "topic": "news",
-    "days": 1,
-    "max_results": 15,
-    "search_depth": "basic"
-}}
-
-SEARCH 2 - Technical & Research News:
-Call tavily_search with:
-{{
-    "query": "machine learning research paper open source AI model release breakthrough",
-    "topic": "news",
-    "days": 1,
-    "max_results": 15,
-    "search_depth": "basic"
-}}
-
-STEP 2: From BOTH search results combined, select the {MAX_ARTICLES} most newsworthy stories.
-
-SELECTION CRITERIA (rank by newsworthiness, NOT by company name):
-1. **Breaking news** - First announcements of something new (product, model, funding, acquisition)
-2. **Significant impact** - News that affects many developers, users, or the industry
-3. **Technical breakthroughs** - Novel research, state-of-the-art results, new capabilities
-4. **Ecosystem changes** - Open source releases, API changes, platform updates
-5. **Market moves** - Funding rounds >$10M, major acquisitions, key partnerships
-
-DIVERSITY REQUIREMENTS:
-- Include stories from DIFFERENT companies/sources (no more than 2 stories from same source)
-- Mix of big tech AND startups/smaller players
-- Mix of product news AND research/technical news
-- Include at least one open source or research paper if available
-
-AVOID:
-- Opinion pieces, editorials, or speculation
-- "Best AI tools" listicles or roundup articles
-- Duplicate coverage of the same story (pick the primary/original source)
-- Vague announcements without concrete details
-- Stories older than 24 hours
-- Clickbait or sensationalist headlines
-
-STEP 3: Format your response as a JSON object:
-{{
-    "introduction": "2-3 sentences highlighting TODAY's most significant AI development. Be specific - mention names, numbers, or capabilities.",
-    "articles": [
-        {{
-            "title": "Clear, specific headline (not clickbait)",
-            "url": "https://source-url.com/article",
-            "summary": "2-3 sentences: What exactly was announced/released? Why is it significant? Include specifics (model name, funding amount, benchmark scores, etc.)",
-            "topics": ["Topic1", "Topic2"],
-            "source": "Original source name"
-        }}
-    ]
-}}
+    for article in articles:
+        url = article.get("url", "")
+        words = set(TITLE_WORD_PATTERN.findall(article.get("title", "").lower()))
 
-Topic categories: Model Release, API Update, Research Paper, Funding, Product Launch, Open Source, Partnership, Regulation, Infrastructure, Robotics, AI Agents, Developer Tools
+        if url and url in seen_urls:
+            continue
+        if words and any(
+            len(words & other) / len(words | other) >= DUPLICATE_TITLE_SIMILARITY
+            for other in seen_titles
+        ):
+            continue
 
-IMPORTANT:
-- Use ONLY tavily_search (NOT tavily_extract) - run it TWICE as specified above
-- Return ONLY valid JSON, no markdown code blocks
-- Include exactly {MAX_ARTICLES} articles with diverse sources
-- Each article must have concrete news value (something happened, was released, or announced)
-- Prioritize PRIMARY sources over secondary coverage"""
+        kept.append(article)
+        if url:
+            seen_urls.add(url)
+        if words:
+            seen_titles.append(words)
 
-    print("🤖 Using Groq + Tavily MCP with dual-search strategy...")
-    result = groq_with_tavily_mcp(prompt)
-    
-    if not result:
-        return {"introduction": "", "articles": []}
-    
-    # Parse JSON from response
+    return kept
+
+
+# Dual-search strategy for diverse, unbiased AI news coverage. Each search
+# runs in its own Groq + Tavily MCP call, and the two calls run in parallel.
+# Search 1: Industry news (product launches, business moves)
+# Search 2: Technical/research news (papers, open source, breakthroughs)
+SEARCH_STRATEGIES = [
+    ("Industry & Product News",
+     "artificial intelligence product launch announcement funding acquisition partnership today"),
+    ("Technical & Research News",
+     "machine learning research paper open source AI model release breakthrough"),
+]
+
+CURATION_PROMPT = """You have access to the Tavily MCP server. Use ONLY the tavily_search tool (not tavily_extract), exactly once, to find {category}:
+{{"query": "{query}", "topic": "news", "days": 1, "max_results": 15, "search_depth": "basic"}}
+
+From the results, select up to {max_articles} stories, ranked by newsworthiness (NOT by company name):
+1. Breaking news - first announcements of a product, model, funding round or acquisition
+2. Significant impact on many developers, users, or the industry
+3. Technical breakthroughs - novel research, state-of-the-art results, new capabilities
+4. Ecosystem changes - open source releases, API changes, platform updates
+5. Market moves - funding rounds >$10M, major acquisitions, key partnerships
+
+Diversity: at most 2 stories per source; mix big tech with startups; include at least one open source release or research paper if available.
+
+Avoid: opinion pieces, listicles/roundups, speculation, clickbait, vague announcements without concrete details, stories older than 24 hours, and duplicate coverage of one story (use the primary/original source).
+
+Return ONLY a JSON object, no markdown code blocks:
+{{"articles": [{{"title": "clear, specific headline", "url": "https://...", "summary": "2-3 sentences: what was announced/released, why it matters, concrete specifics (model name, funding amount, benchmark scores)", "topics": ["Topic1", "Topic2"], "source": "original source name"}}]}}
+
+Topics: Model Release, API Update, Research Paper, Funding, Product Launch, Open Source, Partnership, Regulation, Infrastructure, Robotics, AI Agents, Developer Tools"""
+
+INTRO_PROMPT = """Write the introduction for today's AI news digest: 2-3 sentences highlighting TODAY's most significant AI development among the stories below. Be specific - mention names, numbers, or capabilities. Return only the introduction text.
+
+{stories}"""
+
+
+def is_curation_answer(obj) -> bool:
+    """Check whether a decoded JSON value is the curation answer, not tool arguments."""
+    return isinstance(obj, dict) and "articles" in obj
+
+
+def parse_curated_articles(result: str) -> list[dict]:
+    """
+    Parse the articles out of a curation response and normalize them.
+    Returns an empty list if the response holds no valid JSON object.
+    """
+    # Parse the first JSON object in the response. raw_decode stops at its
+    # closing brace, so markdown fences or trailing prose need no stripping.
     try:
-        cleaned = result.strip()
+        start = result.find('{')
+        if start == -1:
+            raise json.JSONDecodeError("No JSON object found", result, 0)
         
-        # Remove markdown code blocks
-        if cleaned.startswith("```"):
-            cleaned = re.sub(r'^```(?:json)?\n?', '', cleaned)
-            cleaned = re.sub(r'\n?```$', '', cleaned)
-        
-        # Find JSON in the response
-        json_match = re.search(r'\{[\s\S]*\}', cleaned)
-        if json_match:
-            cleaned = json_match.group()
-        
-        data = json.loads(cleaned)
-        print(f"   ✓ Successfully parsed response")
-        return data
+        parsed, _ = json.JSONDecoder().raw_decode(result, start)
     except json.JSONDecodeError as e:
         print(f"✗ Failed to parse JSON response: {e}")
         print(f"  Raw response (first 1000 chars): {result[:1000]}...")
+        return []
+    
+    raw_articles = parsed.get("articles")
+    return [
+        normalize_article(a)
+        for a in (raw_articles if isinstance(raw_articles, list) else [])
+        if isinstance(a, dict)
+    ]
+
+
+def curate_search(category: str, prompt: str) -> list[dict]:
+    """
+    Run one search strategy through Groq + Tavily MCP and parse its picks.
+    Any error is logged and yields no articles, so one failed search never
+    discards the other's results.
+    """
+    try:
+        result = groq_with_tavily_mcp(prompt, is_curation_answer)
+        if not result:
+            return []
+        
+        articles = parse_curated_articles(result)
+    except Exception as e:
+        print(f"✗ {category} search failed: {e!r}")
+        return []
+    
+    print(f"   ✓ {category}: {len(articles)} articles")
+    return articles
+
+
+def write_introduction(articles: list[dict]) -> str:
+    """Ask Groq (without tools) for a short introduction to the curated stories."""
+    stories = "\n".join(
+        f"- {a.get('title', '')}: {a.get('summary', '')}" for a in articles
+    )
+    intro = groq_respond(INTRO_PROMPT.format(stories=stories))
+    return intro.strip()[:MAX_INTRO_CHARS]
+
+
+def search_and_curate_news(date: datetime, use_cache: bool = True) -> dict:
+    """
+    Use Groq + Tavily MCP to search for AI news and curate top stories.
+    Uses two complementary searches for diverse, unbiased coverage, each in
+    its own Groq call; both run in parallel and their picks are interleaved.
+    Credit usage: 2 basic searches/day = ~60 credits/month (well under 1000 limit)
+    
+    A digest already curated for this date with the same prompts is reused
+    unless use_cache is False. A fresh result refreshes the cache only when
+    every search returned articles and the introduction was written.
+    """
+    # Ask each search for its share of the digest plus a couple of spares,
+    # so duplicates across the two searches can be dropped
+    per_search = -(-MAX_ARTICLES // len(SEARCH_STRATEGIES)) + 2
+    prompts = [
+        CURATION_PROMPT.format(category=category, query=query, max_articles=per_search)
+        for category, query in SEARCH_STRATEGIES
+    ]
+
+    key = cache_key("\n\n".join(prompts), date.strftime("%Y-%m-%d"))
+    cached = load_cached_digest(key) if use_cache else None
+    if cached is not None:
+        print("   ✓ Using cached digest from an earlier run today")
+        return cached
+
+    if not check_groq_access():
         return {"introduction": "", "articles": []}
 
+    print("🤖 Using Groq + Tavily MCP with dual-search strategy (searches run in parallel)...")
+    categories = [category for category, _ in SEARCH_STRATEGIES]
+    with ThreadPoolExecutor(max_workers=len(prompts)) as executor:
+        results = list(executor.map(curate_search, categories, prompts))
+    
+    # Interleave by rank so each search contributes its best stories first
+    articles = [
+        a for group in zip_longest(*results) for a in group if a is not None
+    ]
+    unique_articles = dedupe_articles(articles)
+    if len(unique_articles) < len(articles):
+        print(f"   ✓ Removed {len(articles) - len(unique_articles)} duplicate article(s)")
+    unique_articles = unique_articles[:MAX_ARTICLES]
+    
+    if not unique_articles:
+        return {"introduction": "", "articles": []}
+    
+    print("   Writing introduction...")
+    data = {
+        "introduction": write_introduction(unique_articles),
+        "articles": unique_articles,
+    }
+    # Only a complete result is worth reusing; a partial one is retried next run
+    if all(results) and data["introduction"]:
+        save_cached_digest(key, data)
+    else:
+        print("   ⚠ Some Groq calls failed; not caching this partial digest")
+    return data
+
 
 # =============================================================================
 # MARKDOWN OUTPUT - Save digest as a markdown file
 # =============================================================================
 
+# Static parts of digests/README.md; only the table rows change between runs
+INDEX_HEADER = """# 📚 AI News Digest Archive
+
+Daily AI news digests curated from real-time sources using **Groq + Tavily MCP**.
+
+Covering: product launches, research papers, funding rounds, open source releases, and developments across the AI ecosystem.
+
+## 📅 Recent Digests
+
+| Date | Link |
+|------|------|
+"""
+
+INDEX_FOOTER = """
+---
+
+*Updated daily at 8 AM EST • Powered by [Groq](https://groq.com) + [Tavily MCP](https://tavily.com)*
+"""
+
+
+def render_article_markdown(i: int, article: dict) -> str:
+    """Render one numbered article section of the markdown digest."""
+    title = article.get("title", "Untitled")
+    article_url = article.get("url", "")
+    summary = article.get("summary", "No summary available")
+    topics = article.get("topics", ["AI"])
+    source = article.get("source", "")
+    
+    topics_badges = " ".join([f"`{t}`" for t in topics])
+    source_text = f" — *{source}*" if source else ""
+    
+    return f"""### {i}. {title}
+
+{topics_badges}{source_text}
+
+{summary}
+
+🔗 [Read full article]({article_url})
+
+---
+
+"""
+
+
 def save_digest_markdown(date: datetime, intro: str, articles: list[dict]) -> str:
     """
     Save the digest as a beautifully formatted Markdown file.
@@ -241,15 +644,18 @@ def save_digest_markdown(date: datetime, intro: str, articles: list[dict]) -> st
     file_date = date.strftime("%Y-%m-%d")
     filename = f"{DIGEST_DIR}/{file_date}.md"
     
-    # Collect all topics and sources
-    all_topics = set()
+    # Render each article while counting topics and collecting sources for
+    # the header; topics are listed most frequent first
+    topic_counts = Counter()
     all_sources = set()
-    for article in articles:
-        all_topics.update(article.get("topics", []))
+    md_parts = []
+    for i, article in enumerate(articles, 1):
+        topic_counts.update(article.get("topics", []))
         if article.get("source"):
             all_sources.add(article.get("source"))
+        md_parts.append(render_article_markdown(i, article))
     
-    md_content = f"""# 🤖 AI News Digest - {date_str}
+    header = f"""# 🤖 AI News Digest - {date_str}
 
 > {intro}
 
@@ -262,7 +668,7 @@ def save_digest_markdown(date: datetime, intro: str, articles: list[dict]) -> st
 | Metric | Value |
 |--------|-------|
 | **Articles** | {len(articles)} |
-| **Topics** | {', '.join(sorted(all_topics))} |
+| **Topics** | {', '.join(topic for topic, _ in topic_counts.most_common())} |
 | **Sources** | {', '.join(sorted(all_sources)) if all_sources else 'Various'} |
 
 ---
@@ -271,40 +677,18 @@ def save_digest_markdown(date: datetime, intro: str, articles: list[dict]) -> st
 
 """
     
-    for i, article in enumerate(articles, 1):
-        title = article.get("title", "Untitled")
-        article_url = article.get("url", "")
-        summary = article.get("summary", "No summary available")
-        topics = article.get("topics", ["AI"])
-        source = article.get("source", "")
-        
-        topics_badges = " ".join([f"`{t}`" for t in topics])
-        source_text = f" — *{source}*" if source else ""
-        
-        md_content += f"""### {i}. {title}
-
-{topics_badges}{source_text}
-
-{summary}
-
-🔗 [Read full article]({article_url})
-
----
-
-"""
-    
-    md_content += f"""
+    footer = f"""
 ## 📅 Archive
 
 Browse all digests in the [`digests/`](.) folder.
 
 ---
 
-*Generated on {date.strftime("%Y-%m-%d at %H:%M UTC")} • Runs daily at 8 AM EST*
+*Generated on {date.strftime("%Y-%m-%d at %H:%M EST")} • Runs daily at 8 AM EST*
 """
     
     with open(filename, 'w', encoding='utf-8') as f:
-        f.write(md_content)
+        f.write("".join([header, *md_parts, footer]))
     
     print(f"✓ Digest saved to: {filename}")
     return filename
@@ -313,60 +697,53 @@ Browse all digests in the [`digests/`](.) folder.
 def update_readme_index(date: datetime):
     """
     Update the digests/README.md with an index of all digests.
+    Expects DIGEST_DIR to exist; save_digest_markdown creates it.
     """
     index_file = f"{DIGEST_DIR}/README.md"
     
     digest_files = []
-    if os.path.exists(DIGEST_DIR):
-        for f in os.listdir(DIGEST_DIR):
-            if f.endswith('.md') and f != 'README.md':
-                digest_files.append(f)
+    with os.scandir(DIGEST_DIR) as entries:
+        for entry in entries:
+            if entry.name.endswith('.md') and entry.name != 'README.md' and entry.is_file():
+                digest_files.append(entry.name)
     
-    digest_files.sort(reverse=True)
+    # Only the newest 30 are listed, so skip sorting the whole archive
+    recent_files = heapq.nlargest(30, digest_files)
     
-    index_content = """# 📚 AI News Digest Archive
-
-Daily AI news digests curated from real-time sources using **Groq + Tavily MCP**.
-
-Covering: product launches, research papers, funding rounds, open source releases, and developments across the AI ecosystem.
-
-## 📅 Recent Digests
-
-| Date | Link |
-|------|------|
-"""
+    index_parts = [INDEX_HEADER]
     
-    for f in digest_files[:30]:
+    for f in recent_files:
         date_str = f.replace('.md', '')
         try:
-            parsed_date = datetime.strptime(date_str, "%Y-%m-%d")
+            parsed_date = datetime.fromisoformat(date_str)
             display_date = parsed_date.strftime("%B %d, %Y")
         except ValueError:
             display_date = date_str
-        index_content += f"| {display_date} | [{date_str}](./{f}) |\n"
+        index_parts.append(f"| {display_date} | [{date_str}](./{f}) |\n")
     
     if len(digest_files) > 30:
-        index_content += f"\n*...and {len(digest_files) - 30} more in this folder*\n"
+        index_parts.append(f"\n*...and {len(digest_files) - 30} more in this folder*\n")
     
-    index_content += """
----
-
-*Updated daily at 8 AM EST • Powered by [Groq](https://groq.com) + [Tavily MCP](https://tavily.com)*
-"""
+    index_parts.append(INDEX_FOOTER)
     
     with open(index_file, 'w', encoding='utf-8') as f:
-        f.write(index_content)
+        f.write("".join(index_parts))
     
     print(f"✓ Index updated: {index_file}")
 
 
 def print_digest_to_console(intro: str, articles: list[dict]):
-    """Print the digest to console for GitHub Actions logs."""
-    print("\n" + "=" * 60)
-    print("📰 TODAY'S AI NEWS DIGEST")
-    print("=" * 60)
-    print(f"\n💡 {intro}\n")
-    print("-" * 60)
+    """
+    Print the digest to console for GitHub Actions logs.
+    The text is assembled first and written with a single print call.
+    """
+    lines = [
+        "\n" + "=" * 60,
+        "📰 TODAY'S AI NEWS DIGEST",
+        "=" * 60,
+        f"\n💡 {intro}\n",
+        "-" * 60,
+    ]
     
     for i, article in enumerate(articles, 1):
         title = article.get("title", "Untitled")
@@ -376,12 +753,13 @@ def print_digest_to_console(intro: str, articles: list[dict]):
         source = article.get("source", "")
         
         source_text = f" [{source}]" if source else ""
-        print(f"\n{i}. {title}{source_text}")
-        print(f"   Topics: {', '.join(topics)}")
-        print(f"   {summary}")
-        print(f"   🔗 {article_url}")
+        lines.append(f"\n{i}. {title}{source_text}")
+        lines.append(f"   Topics: {', '.join(topics)}")
+        lines.append(f"   {summary}")
+        lines.append(f"   🔗 {article_url}")
     
-    print("\n" + "=" * 60)
+    lines.append("\n" + "=" * 60)
+    print("\n".join(lines))
 
 
 # =============================================================================
@@ -405,11 +783,18 @@ def validate_environment() -> bool:
     return True
 
 
-def run_daily_digest():
-    """Main pipeline using Groq + Tavily MCP agentic system."""
+def run_daily_digest(force: bool = False):
+    """
+    Main pipeline using Groq + Tavily MCP agentic system.
+    With force=True, today's cached digest is ignored and news is re-curated.
+    """
+    # One timestamp for the whole run, so the banner, cache key and digest
+    # file can never disagree across midnight
+    today = datetime.now(EST)
+    
     print("=" * 60)
     print(f"🚀 AI News Daily Digest (Groq + Tavily MCP)")
-    print(f"   {datetime.now().strftime('%Y-%m-%d %H:%M')} UTC")
+    print(f"   {today.strftime('%Y-%m-%d %H:%M')} EST")
     print(f"   Model: {GROQ_MODEL}")
     print(f"   Focus: Real-time AI news from official sources")
     print("=" * 60)
@@ -418,7 +803,7 @@ def run_daily_digest():
         return False
     
     print("\n📡 Step 1: Searching real-time AI news via MCP...")
-    digest_data = search_and_curate_news()
+    digest_data = search_and_curate_news(today, use_cache=not force)
     
     introduction = digest_data.get("introduction", "")
     articles = digest_data.get("articles", [])
@@ -429,16 +814,13 @@ def run_daily_digest():
     
     print(f"✓ Curated {len(articles)} articles")
     
-    all_topics = set()
-    for article in articles:
-        all_topics.update(article.get("topics", []))
-    print(f"✓ Topics covered: {', '.join(all_topics)}")
+    topic_counts = Counter(chain.from_iterable(a.get("topics") or () for a in articles))
+    print(f"✓ Topics covered: {', '.join(topic for topic, _ in topic_counts.most_common())}")
     
     if introduction:
         print(f"✓ Introduction: {introduction[:100]}...")
     
     print("\n📝 Step 2: Saving digest...")
-    today = datetime.now(EST)
     
     if not introduction:
         introduction = "Here's your daily roundup of the most important AI news from official sources."
@@ -455,5 +837,13 @@ def run_daily_digest():
 
 
 if __name__ == "__main__":
-    success = run_daily_digest()
+    parser = argparse.ArgumentParser(description="Generate the daily AI news digest.")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="ignore today's cached digest and re-run the Groq + Tavily search",
+    )
+    args = parser.parse_args()
+    
+    success = run_daily_digest(force=args.force)
     exit(0 if success else 1)
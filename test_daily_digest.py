@@ -0,0 +1,66 @@
+"""
+Tests for daily_digest.py that need no API keys or network access.
+Run with: python -m unittest
+"""
+
+import json
+import unittest
+
+import daily_digest
+
+
+class FakeStream:
+    """Stand-in for a streamed requests.Response carrying SSE lines."""
+
+    def __init__(self, lines: list[str]):
+        self.lines = lines
+        self.closed = False
+
+    def iter_lines(self):
+        for line in self.lines:
+            yield line.encode("utf-8")
+
+    def close(self):
+        self.closed = True
+
+
+def sse(event: dict) -> list[str]:
+    """Encode one event as the event:/data: line pair Groq sends."""
+    return [f"event: {event['type']}", "data: " + json.dumps(event), ""]
+
+
+class ReadResponseStreamTest(unittest.TestCase):
+    PREAMBLE = 'Calling tavily_search with {"query": "AI news", "topic": "news", "days": 1}'
+    ANSWER = '{"articles": [{"title": "A", "url": "https://example.com/a"}]}'
+
+    def stream_with_preamble(self) -> FakeStream:
+        lines = []
+        for item_id, text in (("msg_1", self.PREAMBLE), ("msg_2", self.ANSWER)):
+            half = len(text) // 2
+            lines += sse({"type": "response.output_text.delta", "item_id": item_id, "delta": text[:half]})
+            lines += sse({"type": "response.output_text.delta", "item_id": item_id, "delta": text[half:]})
+            lines += sse({"type": "response.output_text.done", "item_id": item_id, "text": text})
+            if item_id == "msg_1":
+                lines += sse({"type": "response.mcp_call.completed", "output": "search results"})
+        lines += sse({"type": "response.completed", "response": {"status": "completed"}})
+        return FakeStream(lines)
+
+    def test_preamble_with_tool_arguments_does_not_end_the_read(self):
+        stream = self.stream_with_preamble()
+        text, _ = daily_digest.read_response_stream(stream, daily_digest.is_curation_answer)
+
+        self.assertEqual(text, self.ANSWER)
+        self.assertTrue(stream.closed)
+        self.assertEqual(len(daily_digest.parse_curated_articles(text)), 1)
+
+    def test_without_predicate_reads_to_the_end_and_returns_last_message(self):
+        stream = self.stream_with_preamble()
+        text, final_response = daily_digest.read_response_stream(stream)
+
+        self.assertEqual(text, self.ANSWER)
+        self.assertFalse(stream.closed)
+        self.assertEqual(final_response, {"status": "completed"})
+
+
+if __name__ == "__main__":
+    unittest.main()